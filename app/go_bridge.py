@@ -1,18 +1,286 @@
-import json
+import asyncio
+import itertools
 import logging
 import os
-import subprocess
-from typing import List, Dict, Any, Optional
+import time
+from typing import List, Dict, Any, Optional, Protocol, Tuple
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Each result line carries the full content of a scraped page, so the
+# default 64 KiB StreamReader line limit is far too small.
+STREAM_LIMIT = 64 * 1024 * 1024
+
+# Every record written by the Go worker starts with the job id, and result
+# records continue with the result key: {"id":N,"result":{...}}
+_RECORD_PREFIX = b'{"id":'
+_RESULT_KEY = b',"result":'
+# ...and end with the result's closing brace, the record's and a newline
+_RECORD_END = b"}}\n"
+
+# Path to the Go scraper executable, resolved once at import
+GO_SCRAPER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "go-scraper", "go-scraper"))
+
+
+def _validate_binary() -> None:
+    """Make sure the Go scraper executable exists and is executable."""
+    if not os.path.isfile(GO_SCRAPER_PATH):
+        error_msg = f"Go scraper executable not found at {GO_SCRAPER_PATH}"
+        logger.error(error_msg)
+        raise FileNotFoundError(error_msg)
+
+    if not os.access(GO_SCRAPER_PATH, os.X_OK):
+        logger.info("Setting executable permissions on %s", GO_SCRAPER_PATH)
+        os.chmod(GO_SCRAPER_PATH, 0o755)
+
+
+def _record_job_id(line: bytes) -> Optional[int]:
+    """Read the job id from the start of a record line, or None if it has none."""
+    if not line.startswith(_RECORD_PREFIX):
+        return None
+    job_id = line[len(_RECORD_PREFIX):line.find(b",", len(_RECORD_PREFIX))]
+    return int(job_id) if job_id.isdigit() else None
+
+
+async def _skip_record(stream: asyncio.StreamReader, consumed: int) -> Optional[int]:
+    """
+    Discard a record line too long for the stream limit, starting with the
+    consumed bytes reported by LimitOverrunError, and return its job id.
+    """
+    head = await stream.readexactly(consumed)
+    while True:
+        try:
+            await stream.readuntil(b"\n")
+            break
+        except asyncio.LimitOverrunError as e:
+            await stream.readexactly(e.consumed)
+    return _record_job_id(head)
+
+
+def _parse_record(line: bytes) -> Tuple[int, Dict[str, Any]]:
+    """
+    Parse a record line from the Go worker into its job id and record.
+
+    Result records are not decoded: the id is read from their fixed prefix
+    and the result kept as an orjson.Fragment of its raw JSON, which the
+    response serialiser copies out as-is. A complete result record always
+    ends with the result's brace and the record's, so any other line is
+    parsed in full and rejected if it is not valid JSON. Summary records are
+    small and parsed normally.
+
+    Raises GoWorkerError if the line is not a valid record.
+    """
+    job_id = _record_job_id(line)
+    comma = line.find(b",", len(_RECORD_PREFIX))
+    if job_id is not None and line.startswith(_RESULT_KEY, comma) and line.endswith(_RECORD_END):
+        # The result runs up to the closing brace of the record
+        return job_id, {"result": orjson.Fragment(line[comma + len(_RESULT_KEY):-len(_RECORD_END) + 1])}
+
+    try:
+        record = orjson.loads(line)
+        return record["id"], record
+    except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+        raise GoWorkerError(f"Malformed record from Go scraper worker: {e!r}") from e
+
+
+class GoWorkerError(RuntimeError):
+    """Raised when the Go scraper cannot be reached or rejects a job."""
+
+
+class GoScraper(Protocol):
+    """A way of running jobs in the Go scraper (see GoWorker and app.go_lib.GoLibrary)."""
+
+    @property
+    def running(self) -> bool: ...
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def submit(self, job: Dict[str, Any]) -> Dict[str, Any]: ...
+
+
+class GoWorker:
+    """
+    A long-lived Go scraper process running in server mode.
+
+    Jobs are written to its stdin and results streamed back from its stdout
+    as newline-delimited JSON, one line per URL, so the process start-up
+    cost and the HTTP connection pool inside Go are shared by every request.
+
+    Go runs jobs concurrently. Every record carries the id of its job, and a
+    reader task routes records to the queue of the job waiting for them.
+    """
+
+    def __init__(self) -> None:
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+        # Queues of the jobs in flight on the current process, by job id
+        self._pending: Dict[int, asyncio.Queue] = {}
+        # Serialises (re)starts and job writes; results are awaited outside it
+        self._lock = asyncio.Lock()
+        self._job_ids = itertools.count(1)
+
+    @property
+    def running(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
 
-def scrape_with_go(urls: List[str], proxies: Optional[List[str]] = None, proxy_type: str = "datacenter",
-                   timeout: int = 10, max_retries: int = 3) -> Dict[str, Any]:
+    async def start(self) -> None:
+        """Start the Go scraper process."""
+        _validate_binary()
+
+        self._proc = await asyncio.create_subprocess_exec(
+            GO_SCRAPER_PATH, "-server",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            limit=STREAM_LIMIT
+        )
+        # Jobs still pending on a previous process are failed by that process's reader
+        self._pending = {}
+        self._reader = asyncio.create_task(self._read_records(self._proc, self._pending))
+        logger.info("Started Go scraper worker (pid %d)", self._proc.pid)
+
+    async def stop(self, timeout: float = 10) -> None:
+        """Close the worker's stdin and wait for it to exit."""
+        if not self.running:
+            return
+
+        self._proc.stdin.close()
+        try:
+            await asyncio.wait_for(self._proc.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Go scraper worker did not exit in time, killing it")
+            self._proc.kill()
+            await self._proc.wait()
+        await self._reader
+
+    async def _read_records(self, proc: asyncio.subprocess.Process, pending: Dict[int, asyncio.Queue]) -> None:
+        """Route each record from the worker to its job until the worker exits."""
+        try:
+            while True:
+                try:
+                    line = await proc.stdout.readuntil(b"\n")
+                except asyncio.IncompleteReadError:
+                    returncode = await proc.wait()
+                    error = GoWorkerError(f"Go scraper worker exited with code {returncode}")
+                    break
+                except asyncio.LimitOverrunError as e:
+                    # A result over STREAM_LIMIT fails only the job it belongs to
+                    job_id = await _skip_record(proc.stdout, e.consumed)
+                    if job_id is None:
+                        raise GoWorkerError("Go scraper worker wrote an oversized line without a job id") from e
+                    _fail_job(pending, job_id, GoWorkerError(
+                        f"Go scraper result is larger than the {STREAM_LIMIT} byte limit"))
+                    continue
+
+                try:
+                    job_id, record = _parse_record(line)
+                except GoWorkerError as e:
+                    # A malformed record fails only its job, as long as it can be told which one
+                    job_id = _record_job_id(line)
+                    if job_id is None:
+                        raise
+                    _fail_job(pending, job_id, e)
+                    continue
+
+                # Jobs whose caller was cancelled are no longer pending
+                queue = pending.get(job_id)
+                if queue is not None:
+                    queue.put_nowait(record)
+
+        except Exception as e:
+            # The stream is out of sync; fail the jobs in flight and restart on the next job
+            logger.error("Failed to read Go scraper worker output: %s", e)
+            error = GoWorkerError(f"Failed to read Go scraper worker output: {e}")
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
+
+        for queue in pending.values():
+            queue.put_nowait(error)
+
+    async def submit(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a job to the worker and wait for its response."""
+        async with self._lock:
+            if not self.running:
+                if self._proc is not None:
+                    logger.warning("Go scraper worker exited with code %d, restarting", self._proc.returncode)
+                await self.start()
+
+            job_id = next(self._job_ids)
+            pending = self._pending
+            queue = pending[job_id] = asyncio.Queue()
+            logger.debug("Submitting job %d with %d URLs to Go worker", job_id, len(job["urls"]))
+
+            try:
+                self._proc.stdin.write(orjson.dumps({"id": job_id, **job}) + b"\n")
+                await self._proc.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError) as e:
+                del pending[job_id]
+                raise GoWorkerError(f"Failed to send job to Go scraper worker: {e}") from e
+
+        try:
+            # Results arrive one record at a time as Go finishes each URL,
+            # followed by a summary record that ends the job
+            results = []
+            while True:
+                record = await queue.get()
+                if isinstance(record, Exception):
+                    raise record
+
+                if "summary" in record:
+                    return {"results": results, **record["summary"]}
+                results.append(record["result"])
+        finally:
+            pending.pop(job_id, None)
+
+
+def _fail_job(pending: Dict[int, asyncio.Queue], job_id: int, error: GoWorkerError) -> None:
+    """Fail a single job in flight, leaving the worker and other jobs running."""
+    logger.error("Go scraper job %d failed: %s", job_id, error)
+    queue = pending.get(job_id)
+    if queue is not None:
+        queue.put_nowait(error)
+
+
+def _error_response(urls: List[str], proxy_type: str, error: str, detailed_error: str,
+                    elapsed_time: float) -> Dict[str, Any]:
+    """
+    Build a result marking every URL as failed with the same error.
+
+    The error strings are built once by the caller and shared by every
+    result, so this stays linear in the number of URLs.
     """
-    Uses the Go scraper executable to scrape URLs concurrently.
+    elapsed_per_url = elapsed_time / len(urls)  # Approximate time per URL
+    error_results = [{
+        "url": url,
+        "error": error,
+        "detailed_error": detailed_error,
+        "success": False,
+        "proxy_used": proxy_type,
+        "attempts_made": 0,
+        "elapsed_seconds": elapsed_per_url
+    } for url in urls]
+
+    return {
+        "results": error_results,
+        "total": len(urls),
+        "successful": 0,
+        "failed": len(urls),
+        "total_time_seconds": elapsed_time,
+        "proxy_type_used": proxy_type
+    }
+
+
+async def scrape_with_go(worker: GoScraper, urls: List[str], proxies: Optional[List[str]] = None,
+                         proxy_type: str = "datacenter", timeout: int = 10, max_retries: int = 3) -> Dict[str, Any]:
+    """
+    Uses the Go scraper to scrape URLs concurrently.
 
     Args:
+        worker: Running Go scraper, either a GoWorker or a GoLibrary
         urls: List of URLs to scrape
         proxies: List of proxy URLs to use
         proxy_type: Type of proxies (datacenter, residential, etc.)
@@ -20,7 +288,8 @@ def scrape_with_go(urls: List[str], proxies: Optional[List[str]] = None, proxy_t
         max_retries: Maximum number of retries for each URL
 
     Returns:
-        Dictionary with detailed scraping results
+        Dictionary with detailed scraping results. Results from the worker
+        are orjson.Fragment objects holding each result's raw JSON.
     """
     if not urls:
         logger.warning("No URLs provided to scrape_with_go")
@@ -33,116 +302,46 @@ def scrape_with_go(urls: List[str], proxies: Optional[List[str]] = None, proxy_t
             "proxy_type_used": proxy_type
         }
 
-    # Path to the Go scraper executable
-    go_scraper_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "go-scraper", "go-scraper")
-
-    # Make sure the executable exists and is executable
-    if not os.path.isfile(go_scraper_path):
-        error_msg = f"Go scraper executable not found at {go_scraper_path}"
-        logger.error(error_msg)
-        raise FileNotFoundError(error_msg)
-
-    if not os.access(go_scraper_path, os.X_OK):
-        logger.info(f"Setting executable permissions on {go_scraper_path}")
-        os.chmod(go_scraper_path, 0o755)
+    job = {
+        "urls": urls,
+        "proxies": proxies or [],
+        "proxy_type": proxy_type,
+        "timeout": timeout,
+        "max_retries": max_retries
+    }
 
-    # Build command arguments
-    cmd = [
-        go_scraper_path,
-        "-urls", ",".join(urls),
-        "-proxy-type", proxy_type,
-        "-timeout", str(timeout),
-        "-max-retries", str(max_retries)
-    ]
-
-    # Add proxies if provided
     if proxies:
         # Log the number of proxies without exposing credentials
-        logger.info(f"Using {len(proxies)} proxies of type {proxy_type}")
-        cmd.extend(["-proxies", ",".join(proxies)])
+        logger.info("Using %d proxies of type %s", len(proxies), proxy_type)
     else:
-        logger.warning(f"No proxies provided for {len(urls)} URLs")
+        logger.warning("No proxies provided for %d URLs", len(urls))
 
-    logger.info(f"Running Go scraper with {len(urls)} URLs, timeout={timeout}s, max_retries={max_retries}")
+    logger.info("Running Go scraper with %d URLs, timeout=%ds, max_retries=%d", len(urls), timeout, max_retries)
 
-    process = None
-    start_time = os.times()
+    start_ns = time.perf_counter_ns()
 
     try:
-        # Run the Go scraper and capture its output
-        logger.debug(f"Executing command: {' '.join(cmd)}")
-        process = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        end_time = os.times()
+        result = await worker.submit(job)
+        elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+        logger.info("Go scraper completed successfully in %.2f seconds", elapsed_time)
+        logger.info("Scraped %d URLs. Success: %d, Failed: %d", result["total"], result["successful"], result["failed"])
 
-        # Parse the JSON output
-        result = json.loads(process.stdout)
+        return result
 
-        elapsed_time = end_time.elapsed - start_time.elapsed
-        logger.info(f"Go scraper completed successfully in {elapsed_time:.2f} seconds")
-        logger.info(f"Scraped {result['total']} URLs. Success: {result['successful']}, Failed: {result['failed']}")
+    except GoWorkerError as e:
+        logger.error("Go scraper worker failed: %s", e)
 
-        return result
+        elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
 
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Go scraper failed with exit code {e.returncode}")
-        logger.error(f"Stdout: {e.stdout}")
-        logger.error(f"Stderr: {e.stderr}")
-
-        # Return detailed error result
-        end_time = os.times()
-        elapsed_time = end_time.elapsed - start_time.elapsed
-
-        # Create a detailed error result for each URL
-        error_results = []
-        for url in urls:
-            error_results.append({
-                "url": url,
-                "error": f"Go scraper process failed with code {e.returncode}",
-                "detailed_error": f"STDOUT: {e.stdout}\nSTDERR: {e.stderr}\nCommand: {' '.join(cmd)}",
-                "success": False,
-                "proxy_used": proxy_type,
-                "attempts_made": 0,
-                "elapsed_seconds": elapsed_time / len(urls)  # Approximate time per URL
-            })
+        return _error_response(urls, proxy_type, "Go scraper worker failed", str(e), elapsed_time)
 
-        return {
-            "results": error_results,
-            "total": len(urls),
-            "successful": 0,
-            "failed": len(urls),
-            "total_time_seconds": elapsed_time,
-            "proxy_type_used": proxy_type
-        }
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to parse Go scraper output: %s", e)
 
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse Go scraper output: {e}")
-        if process:
-            logger.error(f"Output: {process.stdout}")
-
-        # Return detailed error result for JSON parse failure
-        end_time = os.times()
-        elapsed_time = end_time.elapsed - start_time.elapsed
-
-        error_results = []
-        for url in urls:
-            stdout_snippet = process.stdout[:1000] + "..." if process and len(process.stdout) > 1000 else (
-                process.stdout if process else "None")
-
-            error_results.append({
-                "url": url,
-                "error": "Failed to parse Go scraper output",
-                "detailed_error": f"JSON Parse Error: {str(e)}\nOutput (truncated): {stdout_snippet}",
-                "success": False,
-                "proxy_used": proxy_type,
-                "attempts_made": 0,
-                "elapsed_seconds": elapsed_time / len(urls)  # Approximate time per URL
-            })
+        elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
 
-        return {
-            "results": error_results,
-            "total": len(urls),
-            "successful": 0,
-            "failed": len(urls),
-            "total_time_seconds": elapsed_time,
-            "proxy_type_used": proxy_type
-        }
\ No newline at end of file
+        output = e.doc
+        stdout_snippet = output[:1000] + "..." if len(output) > 1000 else output
+
+        return _error_response(urls, proxy_type, "Failed to parse Go scraper output",
+                               f"JSON Parse Error: {str(e)}\nOutput (truncated): {stdout_snippet}", elapsed_time)
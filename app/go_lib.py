@@ -0,0 +1,86 @@
+import asyncio
+import ctypes
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+
+import orjson
+
+from app.go_bridge import GoWorkerError
+
+logger = logging.getLogger(__name__)
+
+# Path to the Go scraper shared library, resolved once at import
+GO_SCRAPER_LIB_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "go-scraper", "libgoscraper.so"))
+
+# Default number of jobs run in the library at once. The threads mostly sit
+# blocked in Go waiting on the network, so this can be well above the CPU count.
+DEFAULT_MAX_JOBS = 64
+
+
+class GoLibrary:
+    """
+    The Go scraper loaded in-process as a c-shared library.
+
+    A drop-in alternative to GoWorker: jobs are handed to Go through a
+    single ctypes call instead of a pipe. ctypes releases the GIL for the
+    duration of the call, which runs on a dedicated thread pool.
+
+    Each job holds one of the pool's max_jobs threads until every URL in it
+    is done, which can take up to timeout x max_retries. Jobs beyond that
+    limit wait for a free thread, and the wait counts as scraper time.
+    """
+
+    def __init__(self, max_jobs: int = DEFAULT_MAX_JOBS) -> None:
+        self._lib: Optional[ctypes.CDLL] = None
+        self._max_jobs = max_jobs
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def running(self) -> bool:
+        return self._lib is not None
+
+    async def start(self) -> None:
+        """Load the Go scraper library."""
+        if not os.path.isfile(GO_SCRAPER_LIB_PATH):
+            error_msg = f"Go scraper library not found at {GO_SCRAPER_LIB_PATH}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+
+        lib = ctypes.CDLL(GO_SCRAPER_LIB_PATH)
+        lib.Scrape.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.POINTER(ctypes.c_size_t)]
+        # Kept as a raw pointer so it can be handed back to FreeResult
+        lib.Scrape.restype = ctypes.c_void_p
+        lib.FreeResult.argtypes = [ctypes.c_void_p]
+        lib.FreeResult.restype = None
+        self._lib = lib
+        self._executor = ThreadPoolExecutor(max_workers=self._max_jobs, thread_name_prefix="go-scraper")
+        logger.info("Loaded Go scraper library from %s (max_jobs=%d)", GO_SCRAPER_LIB_PATH, self._max_jobs)
+
+    async def stop(self) -> None:
+        """Shut down the thread pool; the Go runtime lives as long as the process."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._lib = None
+
+    async def submit(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a job in the Go library and return its response."""
+        if not self.running:
+            raise GoWorkerError("Go scraper library is not loaded")
+
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(self._executor, self._scrape, orjson.dumps(job))
+        if "error" in response:
+            raise GoWorkerError(response["error"])
+        return response
+
+    def _scrape(self, job: bytes) -> Dict[str, Any]:
+        size = ctypes.c_size_t()
+        raw = self._lib.Scrape(job, len(job), ctypes.byref(size))
+        try:
+            # Parse straight out of Go's buffer rather than copying it into a bytes object first
+            return orjson.loads(memoryview((ctypes.c_char * size.value).from_address(raw)))
+        finally:
+            self._lib.FreeResult(raw)
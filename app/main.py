@@ -1,11 +1,23 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, field_validator, model_validator
-from typing import Dict, List, Any, Optional
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, StringConstraints, field_validator, model_validator
+from typing import Annotated, List, Any, Optional
+import asyncio
+import functools
+import itertools
 import logging
 import os
 import time
+import orjson
 from dotenv import load_dotenv
-from app.go_bridge import scrape_with_go
+from app.go_bridge import GO_SCRAPER_PATH, GoWorker, scrape_with_go
+from app.go_lib import GoLibrary, DEFAULT_MAX_JOBS
+from app.scraper import start_session, close_session, scrape_async
+
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
 
 # Load environment variables
 load_dotenv()
@@ -17,14 +29,86 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+# Run on uvloop when it is installed. uvicorn already selects it with --loop auto
+# or --loop uvloop; this covers servers that create their loop after importing the app.
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Proxy types a request can provide URLs for, in processing order
+PROXY_TYPES = ("datacenter", "residential", "mobile")
+
+# Seconds between background checks that the Go scraper executable exists
+GO_SCRAPER_CHECK_INTERVAL = 30
+
+# Reported by /health, which is polled often by load balancers, so it is
+# checked at import and refreshed in the background rather than per probe
+_go_scraper_exists = os.path.isfile(GO_SCRAPER_PATH)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, which is several times faster than the stdlib encoder."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+app = FastAPI(default_response_class=ORJSONResponse)
+
+
+@app.on_event("startup")
+async def start_scraper():
+    """
+    Start the scraper shared by all requests.
+
+    SCRAPER_BACKEND=go (the default) uses the Go scraper: a long-lived worker
+    process, or the in-process shared library when GO_SCRAPER_MODE=library.
+    SCRAPER_BACKEND=python scrapes with aiohttp inside this process instead.
+    """
+    backend = os.getenv("SCRAPER_BACKEND", "go")
+    app.state.go_scraper = None
+
+    if backend == "python":
+        await start_session()
+        app.state.scrape = scrape_async
+        logger.info("Using Python scraper backend")
+        return
+
+    if backend != "go":
+        raise ValueError(f"Unknown SCRAPER_BACKEND '{backend}', expected 'go' or 'python'")
+
+    mode = os.getenv("GO_SCRAPER_MODE", "worker")
+    if mode == "library":
+        app.state.go_scraper = GoLibrary(max_jobs=int(os.getenv("GO_LIBRARY_MAX_JOBS", DEFAULT_MAX_JOBS)))
+    elif mode == "worker":
+        app.state.go_scraper = GoWorker()
+    else:
+        raise ValueError(f"Unknown GO_SCRAPER_MODE '{mode}', expected 'worker' or 'library'")
+
+    logger.info("Using Go scraper in %s mode", mode)
+    await app.state.go_scraper.start()
+    app.state.scrape = functools.partial(scrape_with_go, app.state.go_scraper)
+
+
+@app.on_event("shutdown")
+async def stop_scraper():
+    """Stop the scraper."""
+    if app.state.go_scraper is not None:
+        await app.state.go_scraper.stop()
+    else:
+        await close_session()
+
+
+# A URL that must start with http:// or https://. The pattern is checked by
+# pydantic-core in Rust rather than by a Python loop over every URL.
+ScrapeURL = Annotated[str, StringConstraints(pattern=r"^https?://")]
 
 
 # Model for the request body - new format
 class ScrapeRequest(BaseModel):
-    datacenter: Optional[List[str]] = None
-    residential: Optional[List[str]] = None
-    mobile: Optional[List[str]] = None
+    datacenter: Optional[List[ScrapeURL]] = None
+    residential: Optional[List[ScrapeURL]] = None
+    mobile: Optional[List[ScrapeURL]] = None
     timeout: int = 5
     max_retries: int = 1
 
@@ -48,43 +132,46 @@ class ScrapeRequest(BaseModel):
 
     @model_validator(mode='after')
     def validate_at_least_one_url_type(self):
-        values = self.model_dump()
         # Check if at least one URL list is provided
-        if not any(values.get(field) for field in ['datacenter', 'residential', 'mobile']):
+        if not any(getattr(self, field) for field in PROXY_TYPES):
             raise ValueError("At least one URL list must be provided")
 
-        # Validate URL format for each list
-        for field in ['datacenter', 'residential', 'mobile']:
-            urls = values.get(field)
-            if urls:
-                for url in urls:
-                    if not url.startswith(('http://', 'https://')):
-                        raise ValueError(f"URL '{url}' in {field} must start with http:// or https://")
-
         return self
 
 
+@functools.lru_cache(maxsize=8)
 def get_proxy_list(proxy_type: str = "datacenter") -> List[str]:
-    """Get proxies from the appropriate environment variable based on type."""
+    """
+    Get proxies from the appropriate environment variable based on type.
+
+    The environment does not change while the process runs, so each list is
+    parsed once and cached. Callers must not modify the returned list.
+    """
     env_var = f"{proxy_type.upper()}_PROXIES"
     proxies_str = os.getenv(env_var, "")
     if not proxies_str:
-        logger.warning(f"No proxies configured in {env_var} environment variable.")
+        logger.warning("No proxies configured in %s environment variable.", env_var)
         return []
 
     # Split by comma
     proxies = [proxy.strip() for proxy in proxies_str.split(",") if proxy.strip()]
-    logger.info(f"Loaded {len(proxies)} proxies of type {proxy_type}")
+    logger.info("Loaded %d proxies of type %s", len(proxies), proxy_type)
     return proxies
 
 
+@app.on_event("startup")
+async def load_proxy_pools():
+    """Load every proxy list once so requests only do a dictionary lookup."""
+    app.state.proxy_pools = {proxy_type: get_proxy_list(proxy_type) for proxy_type in PROXY_TYPES}
+
+
 @app.post("/scrape")
-async def scrape_urls(request: ScrapeRequest) -> Dict[str, Any]:
+async def scrape_urls(request: ScrapeRequest) -> ORJSONResponse:
     """
-    Scrape multiple URLs concurrently using the Go scraper.
+    Scrape multiple URLs concurrently using the configured scraper backend.
     The request can contain URLs for different proxy types.
     """
-    total_start_time = time.time()
+    total_start_ns = time.perf_counter_ns()
     combined_results = {
         "results": [],
         "meta": {
@@ -98,36 +185,35 @@ async def scrape_urls(request: ScrapeRequest) -> Dict[str, Any]:
         "proxy_type_details": {}
     }
 
-    # Process each proxy type
-    for proxy_type in ["datacenter", "residential", "mobile"]:
-        urls = getattr(request, proxy_type, None)
-        if not urls:
-            continue
-
-        logger.info(f"Processing {len(urls)} URLs for proxy type: {proxy_type}")
+    # Collect one batch per proxy type that has URLs
+    batches = [(proxy_type, urls) for proxy_type in PROXY_TYPES if (urls := getattr(request, proxy_type, None))]
+    for proxy_type, urls in batches:
+        logger.info("Processing %d URLs for proxy type: %s", len(urls), proxy_type)
         combined_results["meta"]["total_urls"] += len(urls)
         combined_results["meta"]["proxy_types_used"].append(proxy_type)
 
-        # Get proxies for this type
-        proxies = get_proxy_list(proxy_type)
-
-        # Start time for this batch
-        batch_start_time = time.time()
-
-        # Call the Go scraper through the bridge
-        results = scrape_with_go(
+    # Run all batches concurrently through the configured scraper backend,
+    # using the proxies loaded at startup for each type
+    batch_results = await asyncio.gather(*(
+        app.state.scrape(
             urls=urls,
-            proxies=proxies,
+            proxies=app.state.proxy_pools[proxy_type],
             proxy_type=proxy_type,
             timeout=request.timeout,
             max_retries=request.max_retries
         )
+        for proxy_type, urls in batches
+    ))
 
-        # Record batch time
-        batch_time = time.time() - batch_start_time
+    # Add results to combined results. Most requests use a single proxy type,
+    # so reuse that batch's list as-is instead of copying it.
+    if len(batch_results) == 1:
+        combined_results["results"] = batch_results[0]["results"]
+    else:
+        combined_results["results"] = list(itertools.chain.from_iterable(
+            results["results"] for results in batch_results))
 
-        # Add results to combined results
-        combined_results["results"].extend(results["results"])
+    for (proxy_type, urls), results in zip(batches, batch_results):
         combined_results["meta"]["successful"] += results["successful"]
         combined_results["meta"]["failed"] += results["failed"]
 
@@ -137,21 +223,44 @@ async def scrape_urls(request: ScrapeRequest) -> Dict[str, Any]:
             "successful": results["successful"],
             "failed": results["failed"],
             "time_seconds": results["total_time_seconds"],
-            "proxies_used_count": len(proxies)
+            "proxies_used_count": len(app.state.proxy_pools[proxy_type])
         }
 
     # Calculate total time and overhead
-    total_time = time.time() - total_start_time
+    total_time = (time.perf_counter_ns() - total_start_ns) / 1e9
     combined_results["meta"]["total_time_seconds"] = total_time
 
-    # Calculate Python overhead (difference between total time and sum of Go scraper times)
-    go_time = sum(details["time_seconds"] for details in combined_results["proxy_type_details"].values())
+    # Calculate Python overhead (difference between total time and the scraper time). Batches
+    # run concurrently, so the scraper time is that of the slowest batch.
+    go_time = max((details["time_seconds"] for details in combined_results["proxy_type_details"].values()),
+                  default=0)
     combined_results["meta"]["python_overhead_seconds"] = max(0, total_time - go_time)
 
-    logger.info(f"Total request processing time: {total_time:.2f} seconds")
-    logger.info(f"Python overhead: {combined_results['meta']['python_overhead_seconds']:.2f} seconds")
+    logger.info("Total request processing time: %.2f seconds", total_time)
+    logger.info("Python overhead: %.2f seconds", combined_results["meta"]["python_overhead_seconds"])
+
+    # Return the response directly so FastAPI does not walk the payload with jsonable_encoder first
+    return ORJSONResponse(combined_results)
+
+
+async def _refresh_go_scraper_exists():
+    """Periodically re-check the Go scraper executable, e.g. after it is replaced."""
+    global _go_scraper_exists
+    while True:
+        await asyncio.sleep(GO_SCRAPER_CHECK_INTERVAL)
+        _go_scraper_exists = os.path.isfile(GO_SCRAPER_PATH)
+
+
+@app.on_event("startup")
+async def start_health_refresh():
+    """Start the background check behind /health's go_scraper_exists."""
+    app.state.health_refresh = asyncio.create_task(_refresh_go_scraper_exists())
+
 
-    return combined_results
+@app.on_event("shutdown")
+async def stop_health_refresh():
+    """Stop the background check behind /health's go_scraper_exists."""
+    app.state.health_refresh.cancel()
 
 
 @app.get("/health")
@@ -160,6 +269,5 @@ async def health_check():
     return {
         "status": "healthy",
         "version": os.getenv("APP_VERSION", "0.1.0"),
-        "go_scraper_exists": os.path.isfile(
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "go-scraper", "go-scraper"))
+        "go_scraper_exists": _go_scraper_exists
     }
\ No newline at end of file
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import random
+import time
+from typing import List, Dict, Any, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of URLs fetched at once per batch
+MAX_CONCURRENCY = 64
+
+# Base delay before a retry, doubled after every failed attempt
+RETRY_BACKOFF_SECONDS = 0.1
+
+# Single source of truth for HTTP timeouts, in seconds. The total timeout of
+# each request comes from the API's timeout field and caps all of these.
+HTTP_TIMEOUTS = {
+    "connect": 5,       # Opening a new connection, including the TLS handshake (not the wait for a free pooled one)
+    "keepalive": 30,    # How long idle connections are kept for reuse
+    "dns_cache": 300,   # How long resolved addresses are cached
+}
+
+# Connection pool limits for the shared session
+CONNECTION_LIMITS = {
+    "total": 1024,
+    "per_host": 64,
+}
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36",
+]
+
+# Shared by every request so connections and DNS lookups are reused
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def start_session() -> None:
+    """Create the shared HTTP session."""
+    global _session
+    _session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=CONNECTION_LIMITS["total"],
+            limit_per_host=CONNECTION_LIMITS["per_host"],
+            ttl_dns_cache=HTTP_TIMEOUTS["dns_cache"],
+            keepalive_timeout=HTTP_TIMEOUTS["keepalive"],
+            ssl=False  # Disable SSL verification for performance, as the Go scraper does
+        )
+    )
+    logger.info("Started HTTP session (limit=%d, limit_per_host=%d)",
+                CONNECTION_LIMITS["total"], CONNECTION_LIMITS["per_host"])
+
+
+async def close_session() -> None:
+    """Close the shared HTTP session."""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    if _session is None:
+        raise RuntimeError("HTTP session is not started; call start_session() at startup")
+    return _session
+
+
+async def fetch(url: str, proxies: List[str], proxy_type: str, timeout: int, max_retries: int) -> Dict[str, Any]:
+    """Fetch a single URL, retrying with exponential backoff. Mirrors the Go scraper's result format."""
+    start_ns = time.perf_counter_ns()
+    detailed_error = []
+    attempts_made = 0
+    last_error = None
+    client_timeout = aiohttp.ClientTimeout(total=timeout, sock_connect=min(timeout, HTTP_TIMEOUTS["connect"]))
+    session = _get_session()
+
+    for attempt in range(max_retries):
+        attempts_made += 1
+        if attempt > 0:
+            await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+
+        detailed_error.append(f"--- Attempt {attempt + 1}/{max_retries} ---")
+
+        # Select a random proxy
+        proxy = random.choice(proxies) if proxies else None
+        if proxy:
+            detailed_error.append(f"Using proxy: {proxy.replace(':', '***:', 1)}")  # Hide password in logs
+        else:
+            detailed_error.append("No proxy used")
+
+        try:
+            async with session.get(url, proxy=proxy, timeout=client_timeout,
+                                   headers={"User-Agent": random.choice(USER_AGENTS)}) as resp:
+                body = await resp.read()
+                detailed_error.append(f"Response received with status: {resp.status}")
+                detailed_error.append(f"Successfully read response body ({len(body)} bytes)")
+
+                return {
+                    "url": url,
+                    "status_code": resp.status,
+                    "content": body.decode("utf-8", errors="replace"),
+                    "detailed_error": "\n".join(detailed_error),
+                    "response_headers": {str(k): ", ".join(resp.headers.getall(k)) for k in resp.headers.keys()},
+                    "final_url": str(resp.url),
+                    "elapsed_seconds": (time.perf_counter_ns() - start_ns) / 1e9,
+                    "success": 200 <= resp.status < 300,
+                    "proxy_used": proxy_type,
+                    "attempts_made": attempts_made
+                }
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            last_error = f"{type(e).__name__}: {e}"
+            detailed_error.append(f"Request error: {last_error}")
+
+    return {
+        "url": url,
+        "error": f"All {max_retries} retry attempts failed: {last_error}" if last_error else "Unknown failure in retry logic",
+        "detailed_error": "\n".join(detailed_error),
+        "elapsed_seconds": (time.perf_counter_ns() - start_ns) / 1e9,
+        "success": False,
+        "proxy_used": proxy_type,
+        "attempts_made": attempts_made
+    }
+
+
+async def scrape_async(urls: List[str], proxies: Optional[List[str]] = None, proxy_type: str = "datacenter",
+                       timeout: int = 10, max_retries: int = 3) -> Dict[str, Any]:
+    """
+    Scrapes URLs concurrently in Python with the shared aiohttp session.
+
+    Takes the same arguments and returns the same result format as scrape_with_go.
+    """
+    if proxies:
+        # Log the number of proxies without exposing credentials
+        logger.info("Using %d proxies of type %s", len(proxies), proxy_type)
+    else:
+        logger.warning("No proxies provided for %d URLs", len(urls))
+
+    logger.info("Running Python scraper with %d URLs, timeout=%ds, max_retries=%d", len(urls), timeout, max_retries)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def bounded_fetch(url: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await fetch(url, proxies or [], proxy_type, timeout, max_retries)
+
+    start_ns = time.perf_counter_ns()
+    results = await asyncio.gather(*(bounded_fetch(url) for url in urls))
+    elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+    successful = sum(1 for result in results if result["success"])
+    logger.info("Scraped %d URLs in %.2f seconds. Success: %d, Failed: %d",
+                len(results), elapsed_time, successful, len(results) - successful)
+
+    return {
+        "results": results,
+        "total": len(results),
+        "successful": successful,
+        "failed": len(results) - successful,
+        "total_time_seconds": elapsed_time,
+        "proxy_type_used": proxy_type
+    }
@@ -0,0 +1,56 @@
+//go:build goscraper_lib
+
+// Exports for building the scraper as a shared library that Python loads
+// in-process with ctypes:
+//
+//	go build -tags goscraper_lib -buildmode=c-shared -o libgoscraper.so .
+package main
+
+// #include <stdlib.h>
+import "C"
+
+import (
+	"bytes"
+	"encoding/json"
+	"fmt"
+	"time"
+	"unsafe"
+)
+
+// Scrape runs the Job given as jobLen bytes of JSON and returns its Response
+// as JSON, or an {"error": ...} object if the job cannot be read. The length
+// of the returned buffer is stored in outLen so the caller can read it in
+// place. The caller owns the buffer and must release it with FreeResult.
+//
+//export Scrape
+func Scrape(jobJSON *C.char, jobLen C.int, outLen *C.size_t) *C.char {
+	var job Job
+	if err := json.Unmarshal(C.GoBytes(unsafe.Pointer(jobJSON), jobLen), &job); err != nil {
+		return encodeResult(map[string]string{"error": fmt.Sprintf("Error decoding job: %v", err)}, outLen)
+	}
+
+	startTime := time.Now()
+	results := scrapeURLs(job.URLs, job.Proxies, job.ProxyType, job.Timeout, job.MaxRetries)
+	return encodeResult(newResponse(results, job.ProxyType, time.Since(startTime).Seconds()), outLen)
+}
+
+// FreeResult releases a buffer returned by Scrape
+//
+//export FreeResult
+func FreeResult(result *C.char) {
+	C.free(unsafe.Pointer(result))
+}
+
+// encodeResult encodes v as JSON into a buffer allocated with malloc and
+// stores its length in outLen
+func encodeResult(v interface{}, outLen *C.size_t) *C.char {
+	var buf bytes.Buffer
+	encoder := json.NewEncoder(&buf)
+	encoder.SetEscapeHTML(false)
+	if err := encoder.Encode(v); err != nil {
+		buf.Reset()
+		fmt.Fprintf(&buf, "{\"error\": %q}", fmt.Sprintf("Error encoding response to JSON: %v", err))
+	}
+	*outLen = C.size_t(buf.Len())
+	return (*C.char)(C.CBytes(buf.Bytes()))
+}
@@ -1,6 +1,7 @@
 package main
 
 import (
+	"bufio"
 	"crypto/tls"
 	"encoding/json"
 	"flag"
@@ -31,16 +32,46 @@ type Result struct {
 	AttemptsMade    int               `json:"attempts_made"`
 }
 
+// Summary holds the totals for a batch of results
+type Summary struct {
+	Total            int     `json:"total"`
+	Successful       int     `json:"successful"`
+	Failed           int     `json:"failed"`
+	TotalTimeSeconds float64 `json:"total_time_seconds"`
+	ProxyTypeUsed    string  `json:"proxy_type_used"`
+}
+
 // Response represents the overall response from the scraper
 type Response struct {
-	Results          []Result `json:"results"`
-	Total            int      `json:"total"`
-	Successful       int      `json:"successful"`
-	Failed           int      `json:"failed"`
-	TotalTimeSeconds float64  `json:"total_time_seconds"`
-	ProxyTypeUsed    string   `json:"proxy_type_used"`
+	Results []Result `json:"results"`
+	Summary
+}
+
+// Job represents a single scrape request received in server mode
+type Job struct {
+	ID         int64    `json:"id"`
+	URLs       []string `json:"urls"`
+	Proxies    []string `json:"proxies"`
+	ProxyType  string   `json:"proxy_type"`
+	Timeout    int      `json:"timeout"`
+	MaxRetries int      `json:"max_retries"`
+}
+
+// JobRecord is one line of server mode output: either a single result,
+// written as soon as its URL finishes, or the summary that ends the job.
+// The Python side relies on result records starting with {"id":N,"result":
+// and ending with }}\n to pass results through without decoding them, so
+// keep ID first and Result and Summary the only other fields.
+type JobRecord struct {
+	ID      int64    `json:"id"`
+	Result  *Result  `json:"result,omitempty"`
+	Summary *Summary `json:"summary,omitempty"`
 }
 
+// transports holds one shared *http.Transport per proxy so that connections
+// are pooled across attempts, URLs and (in server mode) jobs
+var transports sync.Map
+
 var userAgents = []string{
 	"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
 	"Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
@@ -54,11 +85,31 @@ func main() {
 	proxyTypeFlag := flag.String("proxy-type", "datacenter", "Type of proxy (datacenter, residential, etc.)")
 	timeoutFlag := flag.Int("timeout", 5, "Timeout in seconds for each request")
 	maxRetriesFlag := flag.Int("max-retries", 1, "Maximum number of retries for each URL")
+	stdinFlag := flag.Bool("stdin", false, "Read URLs from stdin, one per line, instead of -urls")
+	serverFlag := flag.Bool("server", false, "Run as a long-lived worker reading newline-delimited JSON jobs from stdin")
 
 	flag.Parse()
 
-	// Split URLs
-	urls := strings.Split(*urlsFlag, ",")
+	// Performance optimization: Seed the random number generator
+	rand.Seed(time.Now().UnixNano())
+
+	if *serverFlag {
+		runServer()
+		return
+	}
+
+	// Read URLs from stdin, which has no argv size limit, or split -urls
+	var urls []string
+	if *stdinFlag {
+		var err error
+		urls, err = readLines(os.Stdin)
+		if err != nil {
+			fmt.Fprintf(os.Stderr, "Error reading URLs from stdin: %v\n", err)
+			os.Exit(1)
+		}
+	} else {
+		urls = strings.Split(*urlsFlag, ",")
+	}
 	if len(urls) == 0 || (len(urls) == 1 && urls[0] == "") {
 		fmt.Fprintf(os.Stderr, "Error: No URLs provided\n")
 		os.Exit(1)
@@ -84,14 +135,96 @@ func main() {
 		}
 	}
 
-	// Performance optimization: Seed the random number generator
-	rand.Seed(time.Now().UnixNano())
-
 	// Scrape URLs concurrently
 	startTime := time.Now()
 	results := scrapeURLs(cleanUrls, proxies, *proxyTypeFlag, *timeoutFlag, *maxRetriesFlag)
-	elapsedTime := time.Since(startTime).Seconds()
+	response := newResponse(results, *proxyTypeFlag, time.Since(startTime).Seconds())
 
+	// Write response as JSON to stdout
+	encoder := json.NewEncoder(os.Stdout)
+	encoder.SetEscapeHTML(false)
+	if err := encoder.Encode(response); err != nil {
+		fmt.Fprintf(os.Stderr, "Error encoding response to JSON: %v\n", err)
+		os.Exit(1)
+	}
+}
+
+// readLines reads newline-delimited lines until EOF
+func readLines(r io.Reader) ([]string, error) {
+	var lines []string
+	scanner := bufio.NewScanner(r)
+	scanner.Buffer(make([]byte, 0, 64*1024), 1<<20)
+	for scanner.Scan() {
+		lines = append(lines, scanner.Text())
+	}
+	return lines, scanner.Err()
+}
+
+// runServer serves jobs read from stdin until EOF. Each result is written to
+// stdout as its own JobRecord line as soon as it is ready, followed by a
+// summary line once the job is done. Jobs run concurrently, so records of
+// different jobs may be interleaved; they are told apart by job id.
+func runServer() {
+	decoder := json.NewDecoder(bufio.NewReaderSize(os.Stdin, 1<<16))
+	writer := bufio.NewWriterSize(os.Stdout, 1<<16)
+	encoder := json.NewEncoder(writer)
+	encoder.SetEscapeHTML(false)
+
+	var writeMu sync.Mutex
+	writeRecord := func(record JobRecord) {
+		writeMu.Lock()
+		defer writeMu.Unlock()
+
+		if err := encoder.Encode(record); err != nil {
+			fmt.Fprintf(os.Stderr, "Error encoding response to JSON: %v\n", err)
+			os.Exit(1)
+		}
+		if err := writer.Flush(); err != nil {
+			fmt.Fprintf(os.Stderr, "Error writing response: %v\n", err)
+			os.Exit(1)
+		}
+	}
+
+	// Let in-flight jobs finish after stdin is closed
+	var jobs sync.WaitGroup
+	defer jobs.Wait()
+
+	for {
+		var job Job
+		if err := decoder.Decode(&job); err != nil {
+			if err != io.EOF {
+				fmt.Fprintf(os.Stderr, "Error decoding job: %v\n", err)
+				os.Exit(1)
+			}
+			return
+		}
+
+		jobs.Add(1)
+		go func(job Job) {
+			defer jobs.Done()
+
+			startTime := time.Now()
+			successful := 0
+			scrapeURLsEach(job.URLs, job.Proxies, job.ProxyType, job.Timeout, job.MaxRetries, func(result Result) {
+				if result.Success {
+					successful++
+				}
+				writeRecord(JobRecord{ID: job.ID, Result: &result})
+			})
+
+			writeRecord(JobRecord{ID: job.ID, Summary: &Summary{
+				Total:            len(job.URLs),
+				Successful:       successful,
+				Failed:           len(job.URLs) - successful,
+				TotalTimeSeconds: time.Since(startTime).Seconds(),
+				ProxyTypeUsed:    job.ProxyType,
+			}})
+		}(job)
+	}
+}
+
+// newResponse summarizes a batch of results
+func newResponse(results []Result, proxyType string, elapsedTime float64) Response {
 	// Count successful and failed results
 	successful := 0
 	for _, result := range results {
@@ -99,28 +232,62 @@ func main() {
 			successful++
 		}
 	}
-	failed := len(results) - successful
-
-	// Prepare response
-	response := Response{
-		Results:          results,
-		Total:            len(results),
-		Successful:       successful,
-		Failed:           failed,
-		TotalTimeSeconds: elapsedTime,
-		ProxyTypeUsed:    *proxyTypeFlag,
+
+	return Response{
+		Results: results,
+		Summary: Summary{
+			Total:            len(results),
+			Successful:       successful,
+			Failed:           len(results) - successful,
+			TotalTimeSeconds: elapsedTime,
+			ProxyTypeUsed:    proxyType,
+		},
 	}
+}
 
-	// Write response as JSON to stdout
-	encoder := json.NewEncoder(os.Stdout)
-	encoder.SetEscapeHTML(false)
-	if err := encoder.Encode(response); err != nil {
-		fmt.Fprintf(os.Stderr, "Error encoding response to JSON: %v\n", err)
-		os.Exit(1)
+// transportFor returns the shared transport for the given proxy (nil for direct connections)
+func transportFor(proxyURL *url.URL) *http.Transport {
+	key := ""
+	if proxyURL != nil {
+		key = proxyURL.String()
+	}
+	if transport, ok := transports.Load(key); ok {
+		return transport.(*http.Transport)
+	}
+
+	// The transport is shared by every concurrent request, so only idle
+	// connections are capped; MaxConnsPerHost is left unlimited so pooling
+	// never queues requests behind each other.
+	transport := &http.Transport{
+		TLSClientConfig: &tls.Config{
+			InsecureSkipVerify: true, // Disable SSL verification for performance
+		},
+		MaxIdleConns:          100,
+		MaxIdleConnsPerHost:   10,
+		IdleConnTimeout:       30 * time.Second,
+		TLSHandshakeTimeout:   5 * time.Second,
+		ExpectContinueTimeout: 1 * time.Second,
+		DisableKeepAlives:     false,
+	}
+	if proxyURL != nil {
+		transport.Proxy = http.ProxyURL(proxyURL)
 	}
+
+	actual, _ := transports.LoadOrStore(key, transport)
+	return actual.(*http.Transport)
 }
 
 func scrapeURLs(urls []string, proxies []string, proxyType string, timeout int, maxRetries int) []Result {
+	results := make([]Result, 0, len(urls))
+	scrapeURLsEach(urls, proxies, proxyType, timeout, maxRetries, func(result Result) {
+		results = append(results, result)
+	})
+	return results
+}
+
+// scrapeURLsEach scrapes URLs concurrently and calls handle with each result
+// in completion order. handle is only ever called from the calling goroutine.
+func scrapeURLsEach(urls []string, proxies []string, proxyType string, timeout int, maxRetries int, handle func(Result)) {
 	// Create a wait group to track goroutines
 	var wg sync.WaitGroup
 
@@ -139,17 +306,16 @@ func scrapeURLs(urls []string, proxies []string, proxyType string, timeout int,
 		}(url)
 	}
 
-	// Wait for all goroutines to complete
-	wg.Wait()
-	close(resultsChan)
+	// Close the channel once all goroutines are done
+	go func() {
+		wg.Wait()
+		close(resultsChan)
+	}()
 
-	// Collect results from channel
-	var results []Result
+	// Hand out results as they arrive
 	for result := range resultsChan {
-		results = append(results, result)
+		handle(result)
 	}
-
-	return results
 }
 
 func scrapeURL(targetURL string, proxies []string, proxyType string, timeout int, maxRetries int) Result {
@@ -165,48 +331,38 @@ func scrapeURL(targetURL string, proxies []string, proxyType string, timeout int
 		// Record attempt information
 		fmt.Fprintf(&detailedErrorBuilder, "--- Attempt %d/%d at %s ---\n", attempt+1, maxRetries, time.Now().Format(time.RFC3339))
 
-		// Create a custom HTTP client
-		client := &http.Client{
-			Timeout: time.Duration(timeout) * time.Second,
-			Transport: &http.Transport{
-				TLSClientConfig: &tls.Config{
-					InsecureSkipVerify: true, // Disable SSL verification for performance
-				},
-				MaxIdleConns:          100,
-				MaxIdleConnsPerHost:   10,
-				MaxConnsPerHost:       10,
-				IdleConnTimeout:       5 * time.Second,
-				TLSHandshakeTimeout:   5 * time.Second,
-				ExpectContinueTimeout: 1 * time.Second,
-				DisableKeepAlives:     false,
-			},
-			CheckRedirect: func(req *http.Request, via []*http.Request) error {
-				// Record redirect information
-				if len(via) >= 10 {
-					return fmt.Errorf("stopped after 10 redirects")
-				}
-				fmt.Fprintf(&detailedErrorBuilder, "Redirect to: %s\n", req.URL.String())
-				return nil
-			},
-		}
-
 		// Apply proxy if available
+		var proxyURL *url.URL
 		if len(proxies) > 0 {
 			// Select a random proxy
 			selectedProxy = proxies[rand.Intn(len(proxies))]
 			fmt.Fprintf(&detailedErrorBuilder, "Using proxy: %s\n", strings.Replace(selectedProxy, ":", "***:", 1)) // Hide password in logs
 
 			// Set up proxy URL
-			proxyURL, err := url.Parse(selectedProxy)
+			var err error
+			proxyURL, err = url.Parse(selectedProxy)
 			if err != nil {
 				fmt.Fprintf(&detailedErrorBuilder, "Error parsing proxy URL: %v\n", err)
 				continue
 			}
-			client.Transport.(*http.Transport).Proxy = http.ProxyURL(proxyURL)
 		} else {
 			fmt.Fprintf(&detailedErrorBuilder, "No proxy used\n")
 		}
 
+		// Create a client on top of the pooled transport for this proxy
+		client := &http.Client{
+			Timeout:   time.Duration(timeout) * time.Second,
+			Transport: transportFor(proxyURL),
+			CheckRedirect: func(req *http.Request, via []*http.Request) error {
+				// Record redirect information
+				if len(via) >= 10 {
+					return fmt.Errorf("stopped after 10 redirects")
+				}
+				fmt.Fprintf(&detailedErrorBuilder, "Redirect to: %s\n", req.URL.String())
+				return nil
+			},
+		}
+
 		// Create request
 		req, err := http.NewRequest("GET", targetURL, nil)
 		if err != nil {